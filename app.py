@@ -1,13 +1,40 @@
 from __future__ import annotations
 
 import csv
+import io
 import json
-from collections import defaultdict
-from datetime import datetime
+import math
+import os
+import threading
+from abc import ABC, abstractmethod
+from array import array
+from dataclasses import dataclass, field, replace
+from datetime import date
+from functools import wraps
+from operator import attrgetter
 from pathlib import Path
-from typing import Iterable
-
-from flask import Flask, flash, redirect, render_template, request, url_for
+from typing import Any, Callable, Iterable, TypeVar
+
+from flask import (
+    Flask,
+    Response,
+    flash,
+    get_flashed_messages,
+    redirect,
+    render_template,
+    request,
+    stream_template,
+    url_for,
+)
+
+try:
+    import numpy as np
+except ImportError:  # NumPy é opcional; sem ela as colunas usam array.array
+    np = None
+
+ARRAY_TYPECODES = {"float64": "d", "int64": "q"}
+MAX_CATEGORY_KEY = 2**63 - 1
+UNKNOWN_CATEGORY_KEY = -1
 
 app = Flask(__name__)
 app.secret_key = "dev-secret-change-me"
@@ -16,9 +43,207 @@ BASE_DIR = Path(__file__).resolve().parent
 DATA_DIR = BASE_DIR / "data"
 EXPENSES_FILE = DATA_DIR / "expenses.csv"
 CATEGORIES_FILE = DATA_DIR / "categories.csv"
+PAGE_SIZE = 15
+
+T = TypeVar("T")
+
+# Leituras e escritas passam pelo mesmo lock para que o cache em memória
+# e os arquivos CSV não divirjam quando o servidor atende em várias threads.
+storage_lock = threading.RLock()
+
+
+def synchronized(func: Callable[..., T]) -> Callable[..., T]:
+    @wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> T:
+        with storage_lock:
+            return func(*args, **kwargs)
+
+    return wrapper
+
+
+@dataclass(slots=True)
+class Expense:
+    id: int
+    data: str
+    descricao: str
+    valor: float
+    valor_raw: str
+    categoria_id: str
+    anotacao: str
+
+    @property
+    def categoria_nome(self) -> str:
+        return categories_cache.by_id.get(self.categoria_id) or "Categoria removida"
+
+    def as_row(self) -> list[str]:
+        return [
+            str(self.id),
+            self.data,
+            self.descricao,
+            self.valor_raw,
+            self.categoria_id,
+            self.anotacao,
+        ]
+
+
+@dataclass
+class FileCache(ABC):
+    path: Path
+    signature: tuple[int, int] | None = None
+    rows: list[Any] = field(default_factory=list)
+    next_id: int = 1
+    version: int = 0
+
+    def is_fresh(self) -> bool:
+        return self.signature is not None and self.signature == file_signature(self.path)
+
+    @abstractmethod
+    def row_id(self, row: Any) -> int | None:
+        ...
+
+    def index(self, rows: list[Any]) -> None:
+        pass
+
+    def index_row(self, row: Any) -> None:
+        pass
+
+    def store(self, rows: list[Any]) -> None:
+        # A assinatura só é gravada depois que todo o estado derivado foi
+        # montado, para que uma falha no meio não deixe o cache "fresco".
+        self.signature = None
+        ids = [row_id for row_id in map(self.row_id, rows) if row_id is not None]
+        self.index(rows)
+        self.rows = rows
+        self.next_id = max(self.next_id, max(ids, default=0) + 1)
+        self.version += 1
+        self.signature = file_signature(self.path)
+
+    def append(self, row: Any) -> None:
+        self.signature = None
+        row_id = self.row_id(row) or 0
+        self.index_row(row)
+        self.rows.append(row)
+        self.next_id = max(self.next_id, row_id + 1)
+        self.version += 1
+        self.signature = file_signature(self.path)
+
+    def invalidate(self) -> None:
+        self.signature = None
+
+
+@dataclass
+class CategoryCache(FileCache):
+    rows: list[dict[str, str]] = field(default_factory=list)
+    by_id: dict[str, str] = field(default_factory=dict)
+    by_lower_name: dict[str, str] = field(default_factory=dict)
+    sorted_rows: list[dict[str, str]] = field(default_factory=list)
+
+    def row_id(self, row: dict[str, str]) -> int | None:
+        return int(row["id"]) if row["id"].isdecimal() else None
+
+    def index(self, rows: list[dict[str, str]]) -> None:
+        by_lower_name: dict[str, str] = {}
+        for row in rows:
+            by_lower_name.setdefault(row["nome"].lower(), row["id"])
+        self.by_id = {row["id"]: row["nome"] for row in rows}
+        self.by_lower_name = by_lower_name
+        self.sorted_rows = sorted(rows, key=category_sort_key)
+
+    def index_row(self, row: dict[str, str]) -> None:
+        self.by_id[row["id"]] = row["nome"]
+        self.by_lower_name.setdefault(row["nome"].lower(), row["id"])
+        self.sorted_rows = sorted([*self.rows, row], key=category_sort_key)
+
+
+def category_sort_key(category: dict[str, str]) -> str:
+    return category["nome"].lower()
+
+
+@dataclass
+class ExpenseCache(FileCache):
+    rows: list[Expense] = field(default_factory=list)
+    by_id: dict[int, Expense] = field(default_factory=dict)
+    oldest_first: list[Expense] = field(default_factory=list)
+    unparsed_rows: list[list[str]] = field(default_factory=list)
+    valores: Any = field(default_factory=list)
+    categoria_ids: Any = field(default_factory=list)
+    columns_dirty: bool = True
+
+    def row_id(self, row: Expense) -> int:
+        return row.id
+
+    def index(self, rows: list[Expense]) -> None:
+        by_id: dict[int, Expense] = {}
+        for row in rows:
+            by_id.setdefault(row.id, row)
+        self.by_id = by_id
+        self.oldest_first = sorted(rows, key=attrgetter("id"))
+        self.columns_dirty = True
+
+    def index_row(self, row: Expense) -> None:
+        self.by_id.setdefault(row.id, row)
+        self.oldest_first.append(row)
+        self.columns_dirty = True
+
+    def columns(self) -> tuple[Any, Any]:
+        if self.columns_dirty:
+            self.valores = build_column((row.valor for row in self.rows), "float64")
+            self.categoria_ids = build_column(
+                (parse_category_key(row.categoria_id) for row in self.rows), "int64"
+            )
+            self.columns_dirty = False
+        return self.valores, self.categoria_ids
+
+    def newest(self, start: int = 0, count: int | None = None) -> list[Expense]:
+        end = len(self.oldest_first) - start
+        begin = 0 if count is None else end - count
+        return self.oldest_first[max(begin, 0) : max(end, 0)][::-1]
+
+
+def parse_valor(raw: str) -> float:
+    try:
+        return float((raw or "0").replace(",", "."))
+    except ValueError:
+        return 0.0
+
+
+def parse_category_key(raw: str) -> int:
+    if not raw.isdecimal():
+        return UNKNOWN_CATEGORY_KEY
+    key = int(raw)
+    # Ids que não cabem numa coluna int64 contam como categoria removida
+    return key if key <= MAX_CATEGORY_KEY else UNKNOWN_CATEGORY_KEY
+
+
+def build_column(values: Iterable[Any], dtype: str) -> Any:
+    if np is not None:
+        return np.fromiter(values, dtype=dtype)
+    return array(ARRAY_TYPECODES[dtype], values)
 
 
+def file_signature(path: Path) -> tuple[int, int]:
+    stat = path.stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+@dataclass
+class AdminSummary:
+    versions: tuple[int, int]
+    total_geral: float
+    por_categoria: dict[str, float]
+    chart_labels: str
+    chart_values: str
+
+
+categories_cache = CategoryCache(CATEGORIES_FILE)
+expenses_cache = ExpenseCache(EXPENSES_FILE)
+admin_summary: AdminSummary | None = None
+storage_ready = False
+
+
+@synchronized
 def ensure_storage() -> None:
+    global storage_ready
     DATA_DIR.mkdir(parents=True, exist_ok=True)
 
     if not CATEGORIES_FILE.exists():
@@ -36,6 +261,8 @@ def ensure_storage() -> None:
     else:
         upgrade_expenses_file()
 
+    storage_ready = True
+
 
 def upgrade_categories_file() -> None:
     with CATEGORIES_FILE.open("r", newline="", encoding="utf-8") as f:
@@ -95,6 +322,7 @@ def append_categories(entries: Iterable[tuple[str, str]]) -> None:
         writer = csv.writer(f)
         for cat_id, name in entries:
             writer.writerow([cat_id, name])
+    categories_cache.invalidate()
 
 
 def upgrade_expenses_file() -> None:
@@ -160,117 +388,136 @@ def upgrade_expenses_file() -> None:
         append_categories(new_categories)
 
 
+@synchronized
 def load_categories_raw() -> list[dict[str, str]]:
-    ensure_storage()
+    if categories_cache.is_fresh():
+        return categories_cache.rows
     categories: list[dict[str, str]] = []
     with CATEGORIES_FILE.open("r", newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
+        reader = csv.reader(f)
+        next(reader, None)
         for row in reader:
-            cat_id = row.get("id", "").strip()
-            nome = row.get("nome", "").strip()
+            if len(row) < 2:
+                continue
+            cat_id = row[0].strip()
+            nome = row[1].strip()
             if cat_id and nome:
                 categories.append({"id": cat_id, "nome": nome})
+    categories_cache.store(categories)
     return categories
 
 
+def write_csv_atomic(path: Path, header: list[str], rows: Iterable[Iterable[str]]) -> None:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(header)
+    writer.writerows(rows)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    with tmp_path.open("w", newline="", encoding="utf-8") as f:
+        f.write(buffer.getvalue())
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+    fsync_directory(path.parent)
+
+
+def fsync_directory(directory: Path) -> None:
+    if os.name == "nt":  # Windows não permite abrir diretórios para fsync
+        return
+    dir_fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(dir_fd)
+    finally:
+        os.close(dir_fd)
+
+
+@synchronized
 def save_categories(categories: list[dict[str, str]]) -> None:
-    ensure_storage()
-    with CATEGORIES_FILE.open("w", newline="", encoding="utf-8") as f:
-        writer = csv.writer(f)
-        writer.writerow(["id", "nome"])
-        for category in categories:
-            writer.writerow([category["id"], category["nome"]])
+    write_csv_atomic(
+        CATEGORIES_FILE,
+        ["id", "nome"],
+        [(category["id"], category["nome"]) for category in categories],
+    )
+    categories_cache.store(categories)
 
 
 def read_categories() -> list[dict[str, str]]:
-    categories = load_categories_raw()
-    return sorted(categories, key=lambda c: c["nome"].lower())
+    load_categories_raw()
+    return categories_cache.sorted_rows
 
 
+@synchronized
 def add_category(nome: str) -> None:
     nome = nome.strip()
     if not nome:
         return
-    categories = read_categories()
-    existing = {c["nome"].lower() for c in categories}
-    if nome.lower() in existing:
+    load_categories_raw()
+    if nome.lower() in categories_cache.by_lower_name:
         return
-    next_id = str(max((int(c["id"]) for c in categories), default=0) + 1)
+    next_id = str(categories_cache.next_id)
     with CATEGORIES_FILE.open("a", newline="", encoding="utf-8") as f:
         writer = csv.writer(f)
         writer.writerow([next_id, nome])
+    categories_cache.append({"id": next_id, "nome": nome})
 
 
-def load_expenses_raw() -> list[dict[str, str]]:
-    ensure_storage()
-    expenses: list[dict[str, str]] = []
+@synchronized
+def load_expenses_raw() -> list[Expense]:
+    if expenses_cache.is_fresh():
+        return expenses_cache.rows
+    expenses: list[Expense] = []
+    unparsed_rows: list[list[str]] = []
     with EXPENSES_FILE.open("r", newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
+        reader = csv.reader(f)
+        next(reader, None)
         for row in reader:
-            exp_id = row.get("id", "").strip()
+            if len(row) < 6:
+                row += [""] * (6 - len(row))
+            exp_id, data, descricao, valor, categoria_id, anotacao = (
+                cell.strip() for cell in row[:6]
+            )
             if not exp_id:
                 continue
+            if not exp_id.isdecimal():
+                # Mantido como está para ser regravado sem alterações
+                unparsed_rows.append([exp_id, data, descricao, valor, categoria_id, anotacao])
+                continue
             expenses.append(
-                {
-                    "id": exp_id,
-                    "data": row.get("data", "").strip(),
-                    "descricao": row.get("descricao", "").strip(),
-                    "valor": (row.get("valor") or "").strip(),
-                    "categoria_id": row.get("categoria_id", "").strip(),
-                    "anotacao": row.get("anotacao", "").strip(),
-                }
+                Expense(
+                    id=int(exp_id),
+                    data=data,
+                    descricao=descricao,
+                    valor=parse_valor(valor),
+                    valor_raw=valor,
+                    categoria_id=categoria_id,
+                    anotacao=anotacao,
+                )
             )
+    expenses_cache.unparsed_rows = unparsed_rows
+    expenses_cache.store(expenses)
     return expenses
 
 
-def save_expenses(expenses: list[dict[str, str]]) -> None:
-    ensure_storage()
-    with EXPENSES_FILE.open("w", newline="", encoding="utf-8") as f:
-        writer = csv.writer(f)
-        writer.writerow(["id", "data", "descricao", "valor", "categoria_id", "anotacao"])
-        for expense in expenses:
-            writer.writerow(
-                [
-                    expense["id"],
-                    expense.get("data", ""),
-                    expense.get("descricao", ""),
-                    expense.get("valor", ""),
-                    expense.get("categoria_id", ""),
-                    expense.get("anotacao", ""),
-                ]
-            )
-
+@synchronized
+def save_expenses(expenses: list[Expense]) -> None:
+    write_csv_atomic(
+        EXPENSES_FILE,
+        ["id", "data", "descricao", "valor", "categoria_id", "anotacao"],
+        [expense.as_row() for expense in expenses] + expenses_cache.unparsed_rows,
+    )
+    expenses_cache.store(expenses)
 
-def read_expenses() -> list[dict[str, str]]:
-    expenses_raw = load_expenses_raw()
-    categories = read_categories()
-    categories_by_id = {cat["id"]: cat["nome"] for cat in categories}
-    processed: list[dict[str, str]] = []
 
-    for expense in expenses_raw:
-        valor_raw = (expense.get("valor") or "0").replace(",", ".")
-        try:
-            valor_float = float(valor_raw)
-        except ValueError:
-            valor_float = 0.0
-        categoria_id = expense.get("categoria_id", "")
-        categoria_nome = categories_by_id.get(categoria_id) or "Categoria removida"
+def read_expenses(start: int = 0, count: int | None = None) -> list[Expense]:
+    load_expenses_raw()
+    load_categories_raw()
+    return expenses_cache.newest(start, count)
 
-        processed.append(
-            {
-                "id": expense["id"],
-                "data": expense.get("data", ""),
-                "descricao": expense.get("descricao", ""),
-                "valor": f"{valor_float:.2f}",
-                "valor_float": valor_float,
-                "categoria_id": categoria_id,
-                "categoria_nome": categoria_nome,
-                "categoria": categoria_nome,
-                "anotacao": expense.get("anotacao", ""),
-            }
-        )
 
-    return sorted(processed, key=lambda item: int(item["id"]), reverse=True)
+def find_expense(expense_id: str) -> Expense | None:
+    if not expense_id.isdecimal():
+        return None
+    return expenses_cache.by_id.get(int(expense_id))
 
 
 def get_next_id(file_path: Path, field: str = "id") -> str:
@@ -293,62 +540,62 @@ def resolve_category_id(identifier: str) -> str | None:
     identifier = identifier.strip()
     if not identifier:
         return None
-    categories = read_categories()
-    lowered = identifier.lower()
-    for category in categories:
-        if identifier == category["id"] or lowered == category["nome"].lower():
-            return category["id"]
-    return None
+    load_categories_raw()
+    if identifier in categories_cache.by_id:
+        return identifier
+    return categories_cache.by_lower_name.get(identifier.lower())
 
 
+@synchronized
 def update_category(category_id: str, novo_nome: str) -> bool:
     novo_nome = novo_nome.strip()
     if not novo_nome:
         return False
 
     categories = load_categories_raw()
-    target = None
-    for category in categories:
-        if category["id"] == category_id:
-            target = category
-            break
-    if not target:
+    if category_id not in categories_cache.by_id:
         return False
 
-    if any(
-        novo_nome.lower() == category["nome"].lower() and category["id"] != category_id
-        for category in categories
-    ):
+    owner_id = categories_cache.by_lower_name.get(novo_nome.lower())
+    if owner_id is not None and owner_id != category_id:
         return False
 
-    target["nome"] = novo_nome
-    save_categories(categories)
+    save_categories(
+        [
+            {"id": category_id, "nome": novo_nome} if category["id"] == category_id else category
+            for category in categories
+        ]
+    )
     return True
 
 
+@synchronized
 def reassign_expenses_category(old_id: str, new_id: str) -> None:
     expenses = load_expenses_raw()
-    changed = False
-    for expense in expenses:
-        if expense.get("categoria_id") == old_id:
-            expense["categoria_id"] = new_id
-            changed = True
-    if changed:
-        save_expenses(expenses)
+    if not any(expense.categoria_id == old_id for expense in expenses):
+        return
+    save_expenses(
+        [
+            replace(expense, categoria_id=new_id) if expense.categoria_id == old_id else expense
+            for expense in expenses
+        ]
+    )
 
 
+@synchronized
 def delete_category(category_id: str) -> bool:
     if category_id == "1":  # Não remover categoria padrão
         return False
     categories = load_categories_raw()
-    filtered = [category for category in categories if category["id"] != category_id]
-    if len(filtered) == len(categories):
+    if category_id not in categories_cache.by_id:
         return False
+    filtered = [category for category in categories if category["id"] != category_id]
     save_categories(filtered)
     reassign_expenses_category(category_id, "1")
     return True
 
 
+@synchronized
 def update_expense(
     expense_id: str,
     data: str,
@@ -358,31 +605,33 @@ def update_expense(
     anotacao: str,
 ) -> bool:
     expenses = load_expenses_raw()
-    updated = False
-    for expense in expenses:
-        if expense["id"] == expense_id:
-            expense["data"] = data
-            expense["descricao"] = descricao
-            expense["valor"] = f"{valor:.2f}"
-            expense["categoria_id"] = categoria_id
-            expense["anotacao"] = anotacao
-            updated = True
-            break
-    if not updated:
+    expense = find_expense(expense_id)
+    if expense is None:
         return False
-    save_expenses(expenses)
+    updated = replace(
+        expense,
+        data=data,
+        descricao=descricao,
+        valor=round(valor, 2),
+        valor_raw=f"{valor:.2f}",
+        categoria_id=categoria_id,
+        anotacao=anotacao,
+    )
+    save_expenses([updated if item is expense else item for item in expenses])
     return True
 
 
+@synchronized
 def delete_expense(expense_id: str) -> bool:
     expenses = load_expenses_raw()
-    filtered = [expense for expense in expenses if expense["id"] != expense_id]
-    if len(filtered) == len(expenses):
+    expense = find_expense(expense_id)
+    if expense is None:
         return False
-    save_expenses(filtered)
+    save_expenses([item for item in expenses if item.id != expense.id])
     return True
 
 
+@synchronized
 def write_expense(
     data: str,
     descricao: str,
@@ -390,20 +639,101 @@ def write_expense(
     categoria_id: str,
     anotacao: str,
 ) -> None:
-    ensure_storage()
-    expense_id = get_next_id(EXPENSES_FILE)
+    load_expenses_raw()
+    expense = Expense(
+        id=expenses_cache.next_id,
+        data=data,
+        descricao=descricao,
+        valor=round(valor, 2),
+        valor_raw=f"{valor:.2f}",
+        categoria_id=categoria_id,
+        anotacao=anotacao,
+    )
     with EXPENSES_FILE.open("a", newline="", encoding="utf-8") as f:
         writer = csv.writer(f)
-        writer.writerow([expense_id, data, descricao, f"{valor:.2f}", categoria_id, anotacao])
+        writer.writerow(expense.as_row())
+    expenses_cache.append(expense)
+
+
+@synchronized
+def expense_totals() -> tuple[float, dict[str, float]]:
+    load_expenses_raw()
+    load_categories_raw()
+    valores, categoria_ids = expenses_cache.columns()
+    categories_by_id = categories_cache.by_id
+
+    por_id: dict[int, float] = {}
+    if np is not None:
+        if len(valores):
+            # Ids vêm de um CSV editável à mão e podem ser enormes; o bincount
+            # roda sobre índices densos para não alocar um array do tamanho do id
+            chaves, indices = np.unique(categoria_ids, return_inverse=True)
+            somas = np.bincount(indices, weights=valores)
+            por_id = {int(cid): float(total) for cid, total in zip(chaves, somas)}
+        total_geral = float(valores.sum())
+    else:
+        total_geral = math.fsum(valores)
+        for valor, cid in zip(valores, categoria_ids):
+            por_id[cid] = por_id.get(cid, 0.0) + valor
+
+    por_categoria: dict[str, float] = {}
+    for cid, total in por_id.items():
+        if cid == UNKNOWN_CATEGORY_KEY:
+            nome = "Categoria removida"
+        else:
+            nome = categories_by_id.get(str(cid)) or "Categoria removida"
+        por_categoria[nome] = por_categoria.get(nome, 0.0) + total
+    return total_geral, dict(sorted(por_categoria.items()))
+
+
+@synchronized
+def read_admin_summary() -> AdminSummary:
+    global admin_summary
+    load_expenses_raw()
+    load_categories_raw()
+    versions = (expenses_cache.version, categories_cache.version)
+    if admin_summary is not None and admin_summary.versions == versions:
+        return admin_summary
+
+    total_geral, por_categoria = expense_totals()
+    labels = list(por_categoria)
+    values = [round(v, 2) for v in por_categoria.values()]
+    admin_summary = AdminSummary(
+        versions=versions,
+        total_geral=round(total_geral, 2),
+        por_categoria=por_categoria,
+        chart_labels=json.dumps(labels, ensure_ascii=False),
+        chart_values=json.dumps(values),
+    )
+    return admin_summary
+
+
+def stream_page(template_name: str, **context: Any) -> Response:
+    # Consome as mensagens flash antes do streaming: depois que os cabeçalhos
+    # são enviados o cookie de sessão não pode mais ser atualizado.
+    get_flashed_messages()
+    return Response(stream_template(template_name, **context))
+
+
+@app.before_request
+def prepare_storage() -> None:
+    if not storage_ready:
+        ensure_storage()
 
 
 @app.route("/")
 def index():
-    expenses = read_expenses()
+    total_expenses = len(load_expenses_raw())
+    total_pages = max(1, math.ceil(total_expenses / PAGE_SIZE))
+    page = min(max(request.args.get("page", 1, type=int), 1), total_pages)
+    expenses = read_expenses((page - 1) * PAGE_SIZE, PAGE_SIZE)
     category_records = read_categories()
-    return render_template(
+    return stream_page(
         "index.html",
         expenses=expenses,
+        total_expenses=total_expenses,
+        page=page,
+        total_pages=total_pages,
         category_records=category_records,
     )
 
@@ -425,7 +755,7 @@ def adicionar():
         return redirect(url_for("index"))
 
     try:
-        data_obj = datetime.strptime(data_str, "%Y-%m-%d")
+        data_obj = date.fromisoformat(data_str)
     except ValueError:
         flash("Data inválida. Use o formato AAAA-MM-DD.", "error")
         return redirect(url_for("index"))
@@ -441,7 +771,7 @@ def adicionar():
         flash("Categoria informada não foi encontrada.", "error")
         return redirect(url_for("index"))
 
-    write_expense(data_obj.strftime("%Y-%m-%d"), descricao, valor, categoria_id, anotacao)
+    write_expense(data_obj.isoformat(), descricao, valor, categoria_id, anotacao)
     flash("Lançamento registrado com sucesso!", "success")
     return redirect(url_for("index"))
 
@@ -485,24 +815,13 @@ def excluir_categoria(category_id: str):
 
 @app.route("/admin")
 def admin():
-    expenses = read_expenses()
-    total_geral = 0.0
-    por_categoria: defaultdict[str, float] = defaultdict(float)
-
-    for item in expenses:
-        valor = item.get("valor_float", 0.0)
-        total_geral += valor
-        por_categoria[item["categoria_nome"]] += valor
-
-    labels = list(por_categoria.keys())
-    values = [round(v, 2) for v in por_categoria.values()]
-
-    return render_template(
+    summary = read_admin_summary()
+    return stream_page(
         "admin.html",
-        total_geral=round(total_geral, 2),
-        por_categoria=dict(sorted(por_categoria.items(), key=lambda x: x[0])),
-        chart_labels=json.dumps(labels, ensure_ascii=False),
-        chart_values=json.dumps(values),
+        total_geral=summary.total_geral,
+        por_categoria=summary.por_categoria,
+        chart_labels=summary.chart_labels,
+        chart_values=summary.chart_values,
     )
 
 
@@ -523,7 +842,7 @@ def editar_lancamento(expense_id: str):
         return redirect(url_for("index"))
 
     try:
-        data_obj = datetime.strptime(data_str, "%Y-%m-%d")
+        data_obj = date.fromisoformat(data_str)
     except ValueError:
         flash("Data inválida. Use o formato AAAA-MM-DD.", "error")
         return redirect(url_for("index"))
@@ -541,7 +860,7 @@ def editar_lancamento(expense_id: str):
 
     if update_expense(
         expense_id,
-        data_obj.strftime("%Y-%m-%d"),
+        data_obj.isoformat(),
         descricao,
         valor,
         categoria_id,